@@ -3,7 +3,11 @@
 import numpy as np
 import pandas as pd
 
-from gdhi_adj.utils.transform_helpers import sum_match_check
+from gdhi_adj.utils.transform_helpers import (
+    lookup_lsoa_year_values,
+    sum_match_check,
+    year_in_years_to_adjust,
+)
 
 
 def calc_non_outlier_proportions(df: pd.DataFrame) -> pd.DataFrame:
@@ -18,22 +22,28 @@ def calc_non_outlier_proportions(df: pd.DataFrame) -> pd.DataFrame:
             LSOAs calculated per year/LAD group.
     """
     # Filter into outlier and non-outlier LSOAs that need adjusting
-    mask = df.apply(lambda r: (r["year"] in r["year_to_adjust"]), axis=1)
-
-    # Calculate the total GDHI for each LAD per year
-    df["lad_total"] = df.groupby(["lad_code", "year"])["con_gdhi"].transform(
-        "sum"
-    )
-
-    # Calculate the total GDHI for each LAD per year for non outlier years
-    df["non_outlier_total"] = (
-        df[~mask].groupby(["lad_code", "year"])["con_gdhi"].transform("sum")
+    mask = year_in_years_to_adjust(df)
+
+    # Calculate the total GDHI for each LAD per year, overall and for non
+    # outlier years, in a single grouped pass
+    totals = (
+        pd.DataFrame(
+            {
+                "lad_total": df["con_gdhi"],
+                "non_outlier_total": df["con_gdhi"].where(~mask),
+            }
+        )
+        .groupby([df["lad_code"], df["year"]], sort=False, observed=True)
+        .transform("sum")
     )
+    df["lad_total"] = totals["lad_total"]
+    df["non_outlier_total"] = totals["non_outlier_total"].where(~mask)
 
     # Guard: if any non_outlier_total is zero this will cause div-by-zero
     # when calculating proportions — raise a clear error with offending groups.
-    zero_mask = df["non_outlier_total"] == 0
-    if zero_mask.any():
+    non_outlier_total = df["non_outlier_total"].to_numpy()
+    if np.any(non_outlier_total == 0):
+        zero_mask = non_outlier_total == 0
         bad_groups = (
             df.loc[zero_mask, ["lad_code", "year"]]
             .drop_duplicates()
@@ -46,7 +56,7 @@ def calc_non_outlier_proportions(df: pd.DataFrame) -> pd.DataFrame:
             f"groups: {bad_list}"
         )
 
-    df["gdhi_proportion"] = df["con_gdhi"] / df["non_outlier_total"]
+    df["gdhi_proportion"] = df["con_gdhi"].to_numpy() / non_outlier_total
 
     return df
 
@@ -65,29 +75,36 @@ def apportion_adjustment(
         pd.DataFrame: DataFrame with outlier values imputed and adjustment.
             values apportioned accross all years within LSOA.
     """
-    adjusted_df = df.merge(
-        imputed_df[["lsoa_code", "year", "imputed_gdhi"]],
-        on=["lsoa_code", "year"],
-        how="left",
+    # Look up the imputed values by (lsoa_code, year) rather than merging
+    adjusted_df = df.reset_index(drop=True)
+    imputed_gdhi = lookup_lsoa_year_values(
+        imputed_df.set_index(["lsoa_code", "year"])["imputed_gdhi"],
+        adjusted_df["lsoa_code"],
+        adjusted_df["year"],
     )
-
-    adjusted_df["adjusted_total"] = adjusted_df[
-        "lad_total"
-    ] - adjusted_df.groupby(["lad_code", "year"])["imputed_gdhi"].transform(
-        "sum"
+    adjusted_df["imputed_gdhi"] = imputed_gdhi
+    adjusted_total = adjusted_df["lad_total"].to_numpy() - (
+        adjusted_df.groupby(["lad_code", "year"], sort=False, observed=True)[
+            "imputed_gdhi"
+        ]
+        .transform("sum")
+        .to_numpy()
     )
-
-    adjusted_df["adjusted_con_gdhi"] = np.where(
-        adjusted_df["imputed_gdhi"].notna(),
-        adjusted_df["imputed_gdhi"],
-        adjusted_df["gdhi_proportion"] * adjusted_df["adjusted_total"],
+    adjusted_df["adjusted_total"] = adjusted_total
+
+    # Start from the imputed values and fill the remaining rows in place
+    adjusted_con_gdhi = imputed_gdhi.copy()
+    not_imputed = np.isnan(imputed_gdhi)
+    adjusted_con_gdhi[not_imputed] = (
+        adjusted_df["gdhi_proportion"].to_numpy()[not_imputed]
+        * adjusted_total[not_imputed]
     )
+    adjusted_df["adjusted_con_gdhi"] = adjusted_con_gdhi
 
     # Adjustment check: sums by (lad_code, year) should match pre- and post-
     # adjustment
-    adjusted_sum_check_df = adjusted_df.copy()
     sum_match_check(
-        adjusted_sum_check_df,
+        adjusted_df,
         grouping_cols=["lad_code", "year"],
         unadjusted_col="con_gdhi",
         adjusted_col="adjusted_con_gdhi",
@@ -97,49 +114,60 @@ def apportion_adjustment(
     return adjusted_df
 
 
-def apportion_negative_adjustment(df: pd.DataFrame) -> pd.DataFrame:
+def apportion_negative_adjustment(
+    df: pd.DataFrame, validate: bool = True
+) -> pd.DataFrame:
     """
     Change negative values to 0 and apportion negative adjustment values to all
     LSOAs within an LAD/year group.
 
     Args:
         df (pd.DataFrame): DataFrame containing data to adjust.
+        validate (bool): If True, check that LAD/year sums match before and
+            after adjustment. Default is True.
 
     Returns:
         pd.DataFrame: DataFrame with negative adjustment values apportioned
             accross all years within LSOA.
     """
-    adjusted_df = df.copy()
+    # Only new columns are added, so the input arrays can be shared
+    adjusted_df = df.copy(deep=False)
 
-    adjusted_df["min_adjusted_gdhi"] = df.groupby(["lad_code", "year"])[
-        "adjusted_con_gdhi"
-    ].transform("min")
+    # A single grouper serves every LAD/year aggregate below
+    lad_year_gdhi = adjusted_df.groupby(
+        ["lad_code", "year"], sort=False, observed=True
+    )["adjusted_con_gdhi"]
 
-    adjusted_df["abs_adjustment_val"] = np.where(
-        adjusted_df["min_adjusted_gdhi"] < 0,
-        abs(adjusted_df["min_adjusted_gdhi"]),
-        0,
-    )
+    adjusted_df["min_adjusted_gdhi"] = lad_year_gdhi.transform("min")
 
-    adjusted_df["over_adjusted_gdhi"] = (
-        adjusted_df["adjusted_con_gdhi"] + adjusted_df["abs_adjustment_val"]
+    # Negated minimum clamped at zero; fmax also maps a NaN minimum to zero
+    abs_adjustment_val = np.fmax(
+        -adjusted_df["min_adjusted_gdhi"].to_numpy(), 0.0
     )
+    adjusted_df["abs_adjustment_val"] = abs_adjustment_val
 
-    adjusted_df["readjusted_con_gdhi"] = (
-        adjusted_df.groupby(["lad_code", "year"])[
-            "over_adjusted_gdhi"
-        ].transform(lambda x: x / x.sum())
-        * adjusted_df["lad_total"]
+    over_adjusted_gdhi = (
+        adjusted_df["adjusted_con_gdhi"].to_numpy() + abs_adjustment_val
     )
+    adjusted_df["over_adjusted_gdhi"] = over_adjusted_gdhi
+
+    if abs_adjustment_val.any():
+        # The added abs_adjustment_val is constant within a LAD/year, so the
+        # over-adjusted total is the adjusted total plus that value per LSOA
+        over_adjusted_total = (
+            lad_year_gdhi.transform("sum").to_numpy()
+            + lad_year_gdhi.transform("count").to_numpy() * abs_adjustment_val
+        )
+        adjusted_df["readjusted_con_gdhi"] = (
+            over_adjusted_gdhi / over_adjusted_total
+        ) * adjusted_df["lad_total"].to_numpy()
+    else:
+        # No LAD/year has a negative value, so there is nothing to reapportion
+        adjusted_df["readjusted_con_gdhi"] = over_adjusted_gdhi.copy()
 
     # Checks after adjustment
     # Check that there are no negative values in adjusted_con_gdhi
-    adjusted_df_check = adjusted_df.copy()
-    negative_value_check = adjusted_df_check[
-        adjusted_df_check["readjusted_con_gdhi"] < 0
-    ].empty
-
-    if negative_value_check is False:
+    if np.any(adjusted_df["readjusted_con_gdhi"].to_numpy() < 0):
         raise ValueError(
             "Negative value check failed: negative values found in "
             "adjusted_con_gdhi after adjustment."
@@ -147,14 +175,14 @@ def apportion_negative_adjustment(df: pd.DataFrame) -> pd.DataFrame:
 
     # Adjustment check: sums by (lad_code, year) should match pre- and post-
     # adjustment
-    adjusted_sum_check_df = adjusted_df.copy()
-    sum_match_check(
-        adjusted_sum_check_df,
-        grouping_cols=["lad_code", "year"],
-        unadjusted_col="con_gdhi",
-        adjusted_col="readjusted_con_gdhi",
-        sum_tolerance=0.000001,
-    )
+    if validate:
+        sum_match_check(
+            adjusted_df,
+            grouping_cols=["lad_code", "year"],
+            unadjusted_col="con_gdhi",
+            adjusted_col="readjusted_con_gdhi",
+            sum_tolerance=0.000001,
+        )
 
     return adjusted_df.sort_values(by=["lad_code", "year"]).reset_index(
         drop=True
@@ -173,39 +201,44 @@ def apportion_rollback_years(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: DataFrame with reapportioned values for rollback years.
     """
-    adjusted_df = df.copy()
-    max_rollback_year = adjusted_df[adjusted_df["rollback_flag"]]["year"].max()
-
-    # Get the last rollback year's gdhi per lsoa and sum per lad
-    lsoa_max_rollback_gdhi = (
-        adjusted_df[adjusted_df["year"] == max_rollback_year]
-        .groupby("lsoa_code")["readjusted_con_gdhi"]
+    # Only new columns are added, so the input arrays can be shared
+    adjusted_df = df.copy(deep=False)
+    max_rollback_year = adjusted_df.loc[
+        adjusted_df["rollback_flag"], "year"
+    ].max()
+
+    # Slice the last rollback year once and get each lsoa's share of its lad
+    # total in that year (an lsoa sits within a single lad)
+    max_rollback_df = adjusted_df.loc[
+        adjusted_df["year"] == max_rollback_year,
+        ["lsoa_code", "lad_code", "readjusted_con_gdhi"],
+    ]
+    lad_max_rollback_sums = max_rollback_df.groupby(
+        "lad_code", sort=False, observed=True
+    )["readjusted_con_gdhi"].transform("sum")
+    lsoa_max_rollback_share = (
+        (max_rollback_df["readjusted_con_gdhi"] / lad_max_rollback_sums)
+        .groupby(max_rollback_df["lsoa_code"], sort=False, observed=True)
         .min()
     )
-    lad_max_rollback_sums = (
-        adjusted_df[adjusted_df["year"] == max_rollback_year]
-        .groupby("lad_code")["readjusted_con_gdhi"]
-        .sum()
-    )
 
-    # Map back to dataframe and calculate
+    # Look the share up onto the dataframe in one pass and calculate (reindex
+    # rather than map, so categorical keys return plain float values)
     adjusted_df["rollback_con_gdhi"] = np.where(
         adjusted_df["rollback_flag"],
         (
             adjusted_df["lad_total"]
-            * (
-                adjusted_df["lsoa_code"].map(lsoa_max_rollback_gdhi)
-                / adjusted_df["lad_code"].map(lad_max_rollback_sums)
-            )
+            * lsoa_max_rollback_share.reindex(
+                adjusted_df["lsoa_code"]
+            ).to_numpy()
         ),
         adjusted_df["readjusted_con_gdhi"],
     )
 
     # Adjustment check: sums by (lad_code, year) should match pre- and post-
     # adjustment
-    adjusted_sum_check_df = adjusted_df.copy()
     sum_match_check(
-        adjusted_sum_check_df,
+        adjusted_df,
         grouping_cols=["lad_code", "year"],
         unadjusted_col="con_gdhi",
         adjusted_col="rollback_con_gdhi",
@@ -3,6 +3,8 @@
 import numpy as np
 import pandas as pd
 
+from gdhi_adj.utils.transform_helpers import lookup_lsoa_year_values
+
 
 def interpolate_imputed_val(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -14,19 +16,29 @@ def interpolate_imputed_val(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: DataFrame containing outlier imputed values.
     """
-    # Interpolate imputed_gdhi where both previous and next safe years exist
-    df["imputed_gdhi"] = np.where(
-        (
-            df["prev_con_gdhi"].notna()
-            & df["next_con_gdhi"].notna()
-            & ~df["rollback_flag"]
-        ),
-        (df["next_con_gdhi"] - df["prev_con_gdhi"])
-        / (df["next_safe_year"] - df["prev_safe_year"])
-        * (df["year"] - df["prev_safe_year"])
-        + df["prev_con_gdhi"],
-        np.nan,
+    # Interpolate imputed_gdhi where both previous and next safe years exist,
+    # working on the underlying arrays rather than on Series
+    prev_con_gdhi = df["prev_con_gdhi"].to_numpy(dtype=float)
+    next_con_gdhi = df["next_con_gdhi"].to_numpy(dtype=float)
+    prev_safe_year = df["prev_safe_year"].to_numpy(dtype=float)
+    next_safe_year = df["next_safe_year"].to_numpy(dtype=float)
+
+    interpolate = (
+        ~np.isnan(prev_con_gdhi)
+        & ~np.isnan(next_con_gdhi)
+        & ~df["rollback_flag"].to_numpy(dtype=bool)
+    )
+    # Only the interpolated rows are computed; all others stay NaN
+    prev_con_gdhi = prev_con_gdhi[interpolate]
+    prev_safe_year = prev_safe_year[interpolate]
+    slope = (next_con_gdhi[interpolate] - prev_con_gdhi) / (
+        next_safe_year[interpolate] - prev_safe_year
     )
+    year = df["year"].to_numpy(dtype=float)[interpolate]
+
+    imputed_gdhi = np.full(len(df), np.nan)
+    imputed_gdhi[interpolate] = slope * (year - prev_safe_year) + prev_con_gdhi
+    df["imputed_gdhi"] = imputed_gdhi
 
     return df
 
@@ -49,15 +61,18 @@ def extrapolate_imputed_val(
     Returns:
         pd.DataFrame: DataFrame containing outlier imputed values.
     """
-    # prepare lookup table of values by (lsoa_code, year)
-    lookup = df[["lsoa_code", "year", "con_gdhi"]].copy()
+    # prepare lookup of values by (lsoa_code, year)
+    lookup = df.set_index(["lsoa_code", "year"])["con_gdhi"]
 
     # Handle cases where only one side is available for extrapolation
     # Get additional safe year and its value, 4 year difference is used to
     # avoid short term fluctuations
+    # For rollback years only next_con_gdhi should populated.
+    extrapolate_from_next = (
+        imputed_df["prev_con_gdhi"].isna() | imputed_df["rollback_flag"]
+    ).to_numpy()
     imputed_df["additional_safe_year"] = np.where(
-        # For rollback years only next_con_gdhi should populated
-        (imputed_df["prev_con_gdhi"].isna() | imputed_df["rollback_flag"]),
+        extrapolate_from_next,
         (imputed_df["next_safe_year"] + 4),
         np.where(
             imputed_df["next_con_gdhi"].isna(),
@@ -65,48 +80,35 @@ def extrapolate_imputed_val(
             np.nan,
         ),
     )
-    imputed_df = imputed_df.merge(
-        lookup.rename(
-            columns={
-                "year": "additional_safe_year",
-                "con_gdhi": "additional_con_gdhi",
-            }
-        ),
-        on=["lsoa_code", "additional_safe_year"],
-        how="left",
+    imputed_df["additional_con_gdhi"] = lookup_lsoa_year_values(
+        lookup, imputed_df["lsoa_code"], imputed_df["additional_safe_year"]
+    )
+
+    # Extrapolate imputed_gdhi where only one side is available. Both
+    # directions are the same straight line through the available safe year
+    # (the anchor) and the additional safe year, so pick the anchor first and
+    # evaluate the line once.
+    anchor_con_gdhi = np.where(
+        extrapolate_from_next,
+        imputed_df["next_con_gdhi"].to_numpy(),
+        imputed_df["prev_con_gdhi"].to_numpy(),
+    )
+    anchor_year = np.where(
+        extrapolate_from_next,
+        imputed_df["next_safe_year"].to_numpy(),
+        imputed_df["prev_safe_year"].to_numpy(),
+    )
+    additional_con_gdhi = imputed_df["additional_con_gdhi"].to_numpy()
+    slope = (additional_con_gdhi - anchor_con_gdhi) / (
+        imputed_df["additional_safe_year"].to_numpy() - anchor_year
+    )
+    extrapolated_gdhi = anchor_con_gdhi + slope * (
+        imputed_df["year"].to_numpy() - anchor_year
     )
 
-    # Extrapolate imputed_gdhi where only one side is available
     imputed_df["imputed_gdhi"] = np.where(
-        imputed_df["imputed_gdhi"].isna()
-        & imputed_df["additional_con_gdhi"].notna(),
-        np.where(
-            (imputed_df["prev_con_gdhi"].isna() | imputed_df["rollback_flag"]),
-            imputed_df["next_con_gdhi"]
-            - (
-                (
-                    imputed_df["additional_con_gdhi"]
-                    - imputed_df["next_con_gdhi"]
-                )
-                / (
-                    imputed_df["additional_safe_year"]
-                    - imputed_df["next_safe_year"]
-                )
-            )
-            * (imputed_df["next_safe_year"] - imputed_df["year"]),
-            imputed_df["prev_con_gdhi"]
-            + (
-                (
-                    imputed_df["prev_con_gdhi"]
-                    - imputed_df["additional_con_gdhi"]
-                )
-                / (
-                    imputed_df["prev_safe_year"]
-                    - imputed_df["additional_safe_year"]
-                )
-            )
-            * (imputed_df["year"] - imputed_df["prev_safe_year"]),
-        ),
+        imputed_df["imputed_gdhi"].isna() & ~np.isnan(additional_con_gdhi),
+        extrapolated_gdhi,
         imputed_df["imputed_gdhi"],
     )
 
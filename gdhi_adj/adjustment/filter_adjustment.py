@@ -13,8 +13,6 @@ def filter_adjust(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Filtered DataFrame with only relevant columns and rows.
     """
-    df = df[df["adjust"].astype("boolean").fillna(False)]
-
     cols_to_keep = [
         "lsoa_code",
         "lad_code",
@@ -22,7 +20,8 @@ def filter_adjust(df: pd.DataFrame) -> pd.DataFrame:
         "year",
     ]
 
-    df = df[cols_to_keep]
+    # Select rows and columns in one pass so only the kept columns are copied
+    df = df.loc[df["adjust"].astype("boolean").fillna(False), cols_to_keep]
 
     return df
 
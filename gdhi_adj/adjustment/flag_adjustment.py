@@ -1,10 +1,13 @@
 """Module for flagging data to adjust data in the gdhi_adj project."""
 
+import numpy as np
 import pandas as pd
 
 from gdhi_adj.utils.transform_helpers import (
+    adjust_year_run_bounds,
     ensure_list,
-    increment_until_not_in,
+    lookup_lsoa_year_values,
+    year_in_years_to_adjust,
 )
 
 
@@ -33,41 +36,30 @@ def identify_safe_years(
     # ensure year_to_adjust is list-like and normalize missing
     df["year_to_adjust"] = df["year_to_adjust"].apply(ensure_list)
 
-    mask = df.apply(lambda r: (r["year"] in r["year_to_adjust"]), axis=1)
+    mask = year_in_years_to_adjust(df)
 
-    safe_years_df = df.loc[mask].copy()
+    safe_years_df = df.loc[mask].reset_index(drop=True)
 
-    # prepare lookup table of values by (lsoa_code, year)
-    lookup = df[["lsoa_code", "year", "con_gdhi"]].copy()
+    # prepare lookup of values by (lsoa_code, year)
+    lookup = df.set_index(["lsoa_code", "year"])["con_gdhi"]
+
+    # The nearest safe years sit either side of the run of consecutive years
+    # to adjust containing each year, kept within the start and end limits
+    run_start, run_end = adjust_year_run_bounds(safe_years_df)
+    year = safe_years_df["year"].to_numpy()
+    prev_safe_year = np.minimum(year, np.maximum(run_start, start_year) - 1)
+    next_safe_year = np.maximum(year, np.minimum(run_end, end_year) + 1)
 
     # Find previous year value not flagged to adjust
-    safe_years_df["prev_safe_year"] = safe_years_df.apply(
-        lambda r: increment_until_not_in(
-            r["year"], r["year_to_adjust"], start_year, is_increasing=False
-        ),
-        axis=1,
-    )
-    safe_years_df = safe_years_df.merge(
-        lookup.rename(
-            columns={"year": "prev_safe_year", "con_gdhi": "prev_con_gdhi"}
-        ),
-        on=["lsoa_code", "prev_safe_year"],
-        how="left",
+    safe_years_df["prev_safe_year"] = prev_safe_year.astype("int64")
+    safe_years_df["prev_con_gdhi"] = lookup_lsoa_year_values(
+        lookup, safe_years_df["lsoa_code"], safe_years_df["prev_safe_year"]
     )
 
     # Find next year value not flagged to adjust
-    safe_years_df["next_safe_year"] = safe_years_df.apply(
-        lambda r: increment_until_not_in(
-            r["year"], r["year_to_adjust"], end_year, is_increasing=True
-        ),
-        axis=1,
-    )
-    safe_years_df = safe_years_df.merge(
-        lookup.rename(
-            columns={"year": "next_safe_year", "con_gdhi": "next_con_gdhi"}
-        ),
-        on=["lsoa_code", "next_safe_year"],
-        how="left",
+    safe_years_df["next_safe_year"] = next_safe_year.astype("int64")
+    safe_years_df["next_con_gdhi"] = lookup_lsoa_year_values(
+        lookup, safe_years_df["lsoa_code"], safe_years_df["next_safe_year"]
     )
 
     return df, safe_years_df
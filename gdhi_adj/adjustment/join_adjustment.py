@@ -23,21 +23,20 @@ def join_analyst_constrained_data(
         how="left",
     )
 
-    # Obtain list of columns to rename
-    exclude_cols = [
-        "lsoa_code",
-        "lsoa_name",
-        "lad_code",
-        "lad_name",
-        "adjust",
-        "year",
+    # Prefix all columns except these with CON_
+    exclude_cols = frozenset(
+        {
+            "lsoa_code",
+            "lsoa_name",
+            "lad_code",
+            "lad_name",
+            "adjust",
+            "year",
+        }
+    )
+    df.columns = [
+        col if col in exclude_cols else f"CON_{col}" for col in df.columns
     ]
-    included_cols = [col for col in df.columns if col not in exclude_cols]
-
-    # Create a renaming dictionary with prefix
-    rename_dict = {col: f"CON_{col}" for col in included_cols}
-
-    df = df.rename(columns=rename_dict)
 
     if df["adjust"].sum() != df_analyst["adjust"].sum():
         raise ValueError(
@@ -45,7 +44,7 @@ def join_analyst_constrained_data(
             " do not match."
         )
 
-    if df.shape[0] != df_constrained.shape[0]:
+    if len(df) != len(df_constrained):
         raise ValueError(
             "Number of rows of constrained data after join has increased."
         )
@@ -80,7 +79,7 @@ def join_analyst_unconstrained_data(
             " do not match."
         )
 
-    if df.shape[0] != df_unconstrained.shape[0]:
+    if len(df) != len(df_unconstrained):
         raise ValueError(
             "Number of rows of unconstrained data after join has increased."
         )
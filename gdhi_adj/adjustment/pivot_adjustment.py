@@ -1,5 +1,6 @@
 """Module for pivoting adjustment data in the gdhi_adj project."""
 
+import numpy as np
 import pandas as pd
 
 
@@ -15,54 +16,33 @@ def pivot_adjustment_long(df: pd.DataFrame) -> pd.DataFrame:
     """
     # Create lists of GDHI columns
     uncon_cols = [col for col in df.columns if col[0].isdigit()]
-    con_cols = [col for col in df.columns if col.startswith("CON_")]
 
     df.rename(columns={"year": "year_to_adjust"}, inplace=True)
 
-    df_uncon = df.melt(
-        id_vars=[
-            "lsoa_code",
-            "lsoa_name",
-            "lad_code",
-            "lad_name",
-            "adjust",
-            "year_to_adjust",
-        ],
-        value_vars=uncon_cols,
-        var_name="year",
-        value_name="uncon_gdhi",
+    id_cols = [
+        "lsoa_code",
+        "lsoa_name",
+        "lad_code",
+        "lad_name",
+        "adjust",
+        "year_to_adjust",
+    ]
+
+    # Build the long frame in one reshape rather than melting the unconstrained
+    # and constrained columns separately and merging them back together.
+    # Values are read column by column so rows are ordered year by year, as
+    # melt would order them. Years without a CON_ column get NaN con_gdhi.
+    n_rows = len(df)
+    df_combined = df[id_cols].iloc[np.tile(np.arange(n_rows), len(uncon_cols))]
+    df_combined = df_combined.reset_index(drop=True)
+    df_combined["year"] = np.repeat(np.array(uncon_cols, dtype=int), n_rows)
+    df_combined["uncon_gdhi"] = df[uncon_cols].to_numpy().ravel(order="F")
+    df_combined["con_gdhi"] = (
+        df.reindex(columns=["CON_" + col for col in uncon_cols])
+        .to_numpy()
+        .ravel(order="F")
     )
 
-    df_con = df.melt(
-        id_vars=[
-            "lsoa_code",
-            "lsoa_name",
-            "lad_code",
-            "lad_name",
-            "adjust",
-            "year_to_adjust",
-        ],
-        value_vars=con_cols,
-        var_name="year",
-        value_name="con_gdhi",
-    ).reset_index(drop=True)
-    df_con["year"] = df_con["year"].str.replace("^CON_", "", regex=True)
-
-    df_combined = df_uncon.merge(
-        df_con,
-        on=[
-            "lsoa_code",
-            "lsoa_name",
-            "lad_code",
-            "lad_name",
-            "adjust",
-            "year_to_adjust",
-            "year",
-        ],
-        how="left",
-    )
-    df_combined["year"] = df_combined["year"].astype(int)
-
     return df_combined
 
 
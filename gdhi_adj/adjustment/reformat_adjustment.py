@@ -40,30 +40,20 @@ def reformat_year_col(
         pd.DataFrame: DataFrame with reformatted columns.
     """
 
-    # Normalize year cells safely (handle NaN and non-string values)
-    def _normalize_year_cell(x: Any) -> str:
+    # Normalize, split and convert each year cell in a single pass
+    def _parse_year_cell(x: Any) -> tuple:
         if x is None or pd.isna(x):
-            return ""
-        return str(x).replace(" ", "")
+            return ()
+        x = str(x).replace(" ", "")
+        return tuple(to_int_list(x.split(","))) if x != "" else ()
 
-    df["year"] = df["year"].apply(_normalize_year_cell)
-    df["year"] = df["year"].apply(lambda x: x.split(",") if x != "" else [])
-    df["year"] = df["year"].apply(to_int_list)
+    years_col = [_parse_year_cell(x) for x in df["year"]]
 
-    df["year"] = df["year"].apply(
-        lambda x: tuple(x) if isinstance(x, (list, tuple, np.ndarray)) else x
-    )
-
-    def _ensure_no_duplicates(seq):
-        if len(seq) != len(set(seq)):
-            raise ValueError(
-                "Duplicate years found in year column within LSOA."
-            )
-
-    df["year"].apply(_ensure_no_duplicates)
+    if any(len(years) != len(set(years)) for years in years_col):
+        raise ValueError("Duplicate years found in year column within LSOA.")
 
     # Check that all years specified for adjustment are within valid range
-    def _ensure_years_in_range(years, start_year, end_year):
+    for years in years_col:
         for year in years:
             if year < start_year or year > end_year:
                 raise ValueError(
@@ -71,8 +61,6 @@ def reformat_year_col(
                     f"{start_year}-{end_year}."
                 )
 
-    df["year"].apply(
-        lambda years: _ensure_years_in_range(years, start_year, end_year)
-    )
+    df["year"] = pd.Series(years_col, index=df.index, dtype=object)
 
     return df
@@ -1,6 +1,6 @@
 """Module for adjusting data in the gdhi_adj project."""
 
-import os
+from pathlib import Path
 
 import pandas as pd
 
@@ -31,9 +31,15 @@ from gdhi_adj.adjustment.reformat_adjustment import (
     reformat_adjust_col,
     reformat_year_col,
 )
-from gdhi_adj.preprocess.calc_preprocess import calc_rate_of_change
+from gdhi_adj.preprocess.calc_preprocess import (
+    calc_rate_of_change_both_ways,
+)
 from gdhi_adj.preprocess.flag_preprocess import flag_rollback_years
-from gdhi_adj.utils.helpers import read_with_schema, write_with_schema
+from gdhi_adj.utils.helpers import (
+    read_with_schema,
+    write_dataframe,
+    write_with_schema,
+)
 from gdhi_adj.utils.logger import GDHI_adj_logger
 
 GDHI_adj_LOGGER = GDHI_adj_logger(__name__)
@@ -75,18 +81,15 @@ def run_adjustment(config: dict) -> None:
     filepath_dict = config[f"adjustment_{local_or_shared}_settings"]
     schema_path = config["pipeline_settings"]["schema_path"]
 
-    input_adj_file_path = (
-        "C:/Users/" + os.getlogin() + filepath_dict["input_adj_file_path"]
-    )
+    # Input and output paths in the config are relative to the home folder
+    user_root = Path.home().as_posix()
+
+    input_adj_file_path = user_root + filepath_dict["input_adj_file_path"]
     input_constrained_file_path = (
-        "C:/Users/"
-        + os.getlogin()
-        + filepath_dict["input_constrained_file_path"]
+        user_root + filepath_dict["input_constrained_file_path"]
     )
     input_unconstrained_file_path = (
-        "C:/Users/"
-        + os.getlogin()
-        + filepath_dict["input_unconstrained_file_path"]
+        user_root + filepath_dict["input_unconstrained_file_path"]
     )
 
     # match = re.search(
@@ -116,7 +119,7 @@ def run_adjustment(config: dict) -> None:
     cord_code_filter = config["user_settings"]["cord_code_filter"]
     credit_debit_filter = config["user_settings"]["credit_debit_filter"]
 
-    output_dir = "C:/Users/" + os.getlogin() + filepath_dict["output_dir"]
+    output_dir = user_root + filepath_dict["output_dir"]
     output_schema_path = (
         schema_path
         + config["pipeline_settings"]["output_adjustment_schema_path"]
@@ -162,6 +165,12 @@ def run_adjustment(config: dict) -> None:
     logger.info("Pivoting DataFrame long")
     df = pivot_adjustment_long(df)
 
+    # Group and join keys repeat for every year, so hold them as categoricals
+    # and the year as a small integer
+    for col in ["lsoa_code", "lad_code"]:
+        df[col] = df[col].astype("category")
+    df["year"] = df["year"].astype("int16")
+
     logger.info("Filtering data for specified years")
     df = filter_year(df, start_year, end_year)
 
@@ -170,16 +179,8 @@ def run_adjustment(config: dict) -> None:
         f"{config["user_settings"]["rollback_year_start"]}:"
         f"{config["user_settings"]["rollback_year_end"]}"
     )
-    df = calc_rate_of_change(
+    df = calc_rate_of_change_both_ways(
         df,
-        ascending=False,
-        sort_cols=["lsoa_code", "year"],
-        group_col="lsoa_code",
-        val_col="uncon_gdhi",
-    )
-    df = calc_rate_of_change(
-        df,
-        ascending=True,
         sort_cols=["lsoa_code", "year"],
         group_col="lsoa_code",
         val_col="uncon_gdhi",
@@ -205,7 +206,9 @@ def run_adjustment(config: dict) -> None:
 
     if config["user_settings"]["accept_negatives"] is False:
         logger.info("Apportioning negative adjusted values")
-        df = apportion_negative_adjustment(df)
+        df = apportion_negative_adjustment(
+            df, validate=config["user_settings"]["validate_negative_sums"]
+        )
 
     logger.info("Apportion rollback years.")
     df = apportion_rollback_years(df)
@@ -227,10 +230,7 @@ def run_adjustment(config: dict) -> None:
     )
 
     logger.info(f"{output_dir + interim_filename}")
-    df.to_csv(
-        output_dir + interim_filename,
-        index=False,
-    )
+    write_dataframe(df, output_dir + interim_filename)
     logger.info("Data saved successfully")
 
     if config["user_settings"]["accept_negatives"] is False:
@@ -2,16 +2,68 @@
 
 import os
 import re
+from pathlib import Path
 
 import pandas as pd
+import pyarrow.parquet as pq
 
-from gdhi_adj.utils.helpers import read_with_schema, write_with_schema
+from gdhi_adj.utils.helpers import (
+    is_parquet_path,
+    read_with_schema,
+    write_with_schema,
+)
 from gdhi_adj.utils.logger import GDHI_adj_logger
 
 # Initialize logger
 GDHI_adj_LOGGER = GDHI_adj_logger(__name__)
 logger = GDHI_adj_LOGGER.logger
 
+# Year value columns: start with 1 or 2, followed by exactly 3 digits
+YEAR_COLUMN_PATTERN = re.compile(r"^[12]\d{3}$")
+
+
+def has_s30_codes(lad_codes):
+    """
+    Check whether any area code starts with S30.
+
+    Args:
+        lad_codes (pd.Series): Series of LAD area codes.
+
+    Returns:
+        bool: True if at least one code starts with S30, otherwise False.
+    """
+    # There are far fewer distinct codes than rows, so only check those,
+    # stopping at the first S30 code found
+    return any(str(code).startswith("S30") for code in lad_codes.unique())
+
+
+def probe_s30_codes(input_file_path, lad_code_col):
+    """
+    Check for S30 codes by reading only the LAD code column of a file.
+
+    Args:
+        input_file_path (str): Filepath to the csv or Parquet file.
+        lad_code_col (str): Name of the LAD code column in the file.
+
+    Returns:
+        bool: True if the column exists and contains S30 codes, otherwise
+            False.
+    """
+    if is_parquet_path(input_file_path):
+        if lad_code_col not in pq.read_schema(input_file_path).names:
+            return False
+        lad_codes = pd.read_parquet(input_file_path, columns=[lad_code_col])
+    else:
+        # A callable usecols leaves an empty frame if the column is missing
+        lad_codes = pd.read_csv(
+            input_file_path, usecols=lambda col: col == lad_code_col
+        )
+
+    if lad_code_col not in lad_codes.columns:
+        return False
+
+    return has_s30_codes(lad_codes[lad_code_col])
+
 
 def rename_s30_to_lau(config, df):
     """
@@ -39,9 +91,7 @@ def rename_s30_to_lau(config, df):
     has_lad_column = lad_code_col in df.columns
     if has_lad_column:
         logger.info(f"Dataframe has column {lad_code_col}")
-        has_S30_codes = (
-            df[lad_code_col].astype(str).str.startswith("S30").any()
-        )
+        has_S30_codes = has_s30_codes(df[lad_code_col])
         if has_S30_codes:
             logger.info("Detected S30 codes in LAD code column")
             logger.info(
@@ -96,10 +146,10 @@ def join_mapper(df, mapper_df):
     Returns:
         pd.DataFrame: DataFrame with LADs joined on LAU codes.
     """
-    result_df = df.merge(
-        mapper_df,
-        left_on="data_lau_code",
-        right_on="mapper_lau_code",
+    # Join on the indexed LAU code, keeping it as a column for the output
+    result_df = df.join(
+        mapper_df.set_index("mapper_lau_code", drop=False),
+        on="data_lau_code",
         how="left",
     )
     null_series = result_df["mapper_lad_code"].isna()
@@ -124,17 +174,12 @@ def aggregate_lad(df):
     """
     geo_columns = ["mapper_lad_code", "mapper_lad_name"]
 
-    # Get all column names
-    all_columns = df.columns.tolist()
-
-    # Define the pattern: starts with 1 or 2, followed by exactly 3 digits
-    pattern = r"^[12]\d{3}$"
-
-    # Filter columns matching the pattern
-    value_columns = [col for col in all_columns if re.match(pattern, col)]
-    other_columns = [
-        col for col in all_columns if col not in geo_columns + value_columns
-    ]
+    # Filter columns matching the year pattern, keeping the column order
+    is_value_column = df.columns.str.match(YEAR_COLUMN_PATTERN, na=False)
+    value_columns = df.columns[is_value_column].tolist()
+    other_columns = df.columns[
+        ~is_value_column & ~df.columns.isin(geo_columns)
+    ].tolist()
 
     agg_columns = geo_columns + other_columns
     agg_df = df.groupby(agg_columns, as_index=False)[value_columns].sum()
@@ -165,7 +210,8 @@ def run_mapping(config: dict, df=pd.DataFrame()):
     Run the mapping steps for the GDHI adjustment pipeline.
 
     This function performs the follwing steps:
-    1. Load the input data.
+    1. Check the LAD code column for S30 codes, stopping if there are none,
+        then load the input data.
     2. Rename column containing S30 values to LAU and verify mapping is
         required.
     If mapping is required:
@@ -177,13 +223,25 @@ def run_mapping(config: dict, df=pd.DataFrame()):
     """
     logger.info("Started mapping LAUs to LADs")
 
+    # Input and output paths in the config are relative to the home folder
+    user_root = Path.home().as_posix()
+
+    input_adj_file_path = os.path.join(
+        user_root,
+        config["mapping_settings"]["input_adj_file_dir"],
+        config["mapping_settings"]["input_adj_file_name"],
+    )
+
+    # Read only the LAD code column first, so the full file is only loaded
+    # and validated when there are LAUs to map
+    if not probe_s30_codes(
+        input_adj_file_path, config["mapping_settings"]["data_lad_code"]
+    ):
+        logger.info("Mapping LAUs to LADs not needed. No S30 codes detected.")
+        return
+
     df = read_with_schema(
-        input_file_path=os.path.join(
-            "C:/Users",
-            os.getlogin(),
-            config["mapping_settings"]["input_adj_file_dir"],
-            config["mapping_settings"]["input_adj_file_name"],
-        ),
+        input_file_path=input_adj_file_path,
         input_schema_path=os.path.join(
             config["pipeline_settings"]["schema_path"],
             config["pipeline_settings"]["output_adjustment_schema_path"],
@@ -193,12 +251,11 @@ def run_mapping(config: dict, df=pd.DataFrame()):
     original_columns = df.columns.tolist()
     df, need_mapping = rename_s30_to_lau(config, df)
 
-    print(f"Mapping needed: {need_mapping}")
+    logger.info(f"Mapping needed: {need_mapping}")
     if need_mapping:
         mapper_df = read_with_schema(
             input_file_path=os.path.join(
-                "C:/Users/",
-                os.getlogin(),
+                user_root,
                 config["mapping_settings"]["input_lau_lad_mapper_dir"],
                 config["mapping_settings"]["input_lau_lad_mapper_file"],
             ),
@@ -235,8 +292,7 @@ def run_mapping(config: dict, df=pd.DataFrame()):
                 config["pipeline_settings"]["output_mapping_schema_path"],
             ),
             output_dir=os.path.join(
-                "C:/Users/",
-                os.getlogin(),
+                user_root,
                 config["mapping_settings"]["output_dir"],
             ),
             new_filename=output_name,
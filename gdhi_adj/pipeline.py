@@ -2,6 +2,8 @@
 
 import time
 
+import pandas as pd
+
 from gdhi_adj.adjustment.run_adjustment import run_adjustment
 from gdhi_adj.mapping.mapping_main import run_mapping
 from gdhi_adj.preprocess.run_preprocess import run_preprocessing
@@ -27,14 +29,17 @@ def run_pipeline(config_path):
     config = load_toml_config(config_path)
 
     try:
-        if config["user_settings"]["preprocessing"]:
-            run_preprocessing(config)
+        # Copy-on-Write lets column selections and shallow copies share data
+        # until they are modified, rather than copying eagerly
+        with pd.option_context("mode.copy_on_write", True):
+            if config["user_settings"]["preprocessing"]:
+                run_preprocessing(config)
 
-        if config["user_settings"]["adjustment"]:
-            run_adjustment(config)
+            if config["user_settings"]["adjustment"]:
+                run_adjustment(config)
 
-        if config["user_settings"]["mapping"]:
-            run_mapping(config)
+            if config["user_settings"]["mapping"]:
+                run_mapping(config)
 
     except Exception as e:
         logger.error(
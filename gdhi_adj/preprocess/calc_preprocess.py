@@ -2,47 +2,66 @@
 
 import numpy as np
 import pandas as pd
-from scipy.stats import zscore
 
 
-def calc_rate_of_change(
+def calc_rate_of_change_both_ways(
     df: pd.DataFrame,
-    ascending: bool,
     sort_cols: list,
     group_col: str,
     val_col: str,
 ) -> pd.DataFrame:
     """
-    Calculate the rate of change going forward and backwards in time in the
-    DataFrame.
+    Calculate the rate of change both backwards and forwards in time, from a
+    single sort of the DataFrame.
+
+    Gives the same backward_pct_change and forward_pct_change columns as a
+    grouped pct_change plus one over rows sorted descending and ascending
+    respectively, with rows returned sorted ascending by sort_cols.
 
     Args:
         df (pd.DataFrame): The input DataFrame.
-        ascending (bool): If True, calculates forward rate of change;
-            otherwise, backward.
         sort_cols (list): Columns to sort by before calculating rate of change.
         group_col (str): The column to group by for rate of change calculation.
         val_col (str): The column for which the rate of change is calculated.
 
     Returns:
         pd.DataFrame: A DataFrame containing the rate of change values.
-    """
-    if ascending:
-        # If ascending, sort in ascending order
-        df = df.sort_values(by=sort_cols).reset_index(drop=True)
 
-        df["forward_pct_change"] = (
-            df.groupby(group_col)[val_col].pct_change() + 1.0
+    Raises:
+        ValueError: If sort_cols does not start with group_col.
+    """
+    if sort_cols[0] != group_col:
+        raise ValueError(
+            f"sort_cols must start with group_col '{group_col}' so that each "
+            "group's rows are contiguous."
         )
 
-    else:
-        # If not ascending, sort in descending order
-        df = df.sort_values(by=sort_cols, ascending=ascending).reset_index(
-            drop=True
-        )
-        df["backward_pct_change"] = (
-            df.groupby(group_col)[val_col].pct_change() + 1.0
-        )
+    df = df.sort_values(by=sort_cols, ignore_index=True)
+    grouped = df.groupby(group_col, sort=False, observed=True)[val_col]
+
+    # Rows of a group are contiguous after sorting, so a group starts and
+    # ends wherever the key changes
+    keys = df[group_col].to_numpy()
+    key_changes = keys[1:] != keys[:-1]
+    group_start = np.ones(len(keys), dtype=bool)
+    group_start[1:] = key_changes
+    group_end = np.ones(len(keys), dtype=bool)
+    group_end[:-1] = key_changes
+
+    # As pct_change does, fill missing values in the direction of travel
+    # before dividing: the backward rate is this year over the next year and
+    # the forward rate is this year over the previous year
+    next_filled = grouped.bfill().to_numpy(dtype="float64")
+    next_vals = np.roll(next_filled, -1)
+    next_vals[group_end] = np.nan
+
+    prev_filled = grouped.ffill().to_numpy(dtype="float64")
+    prev_vals = np.roll(prev_filled, 1)
+    prev_vals[group_start] = np.nan
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        df["backward_pct_change"] = next_filled / next_vals
+        df["forward_pct_change"] = prev_filled / prev_vals
 
     return df
 
@@ -76,11 +95,15 @@ def calc_zscores(
     # If the value column is 1, the data has been rolled back so should not be
     # flagged, else flag based on zscore
     # Calculate z-scores when rollback_flag is false
+    # Standardise with the sample standard deviation, NaNs are omitted
+    # Only the key and value columns are needed, so avoid copying every
+    # column of the masked frame
+    grouped_vals = df.loc[mask, [group_col, val_col]].groupby(
+        group_col, sort=False, observed=True
+    )[val_col]
     df.loc[mask, f"{score_prefix}_zscore"] = (
-        df.loc[mask]
-        .groupby(group_col)[val_col]
-        .transform(lambda x: zscore(x, nan_policy="omit", ddof=1))
-    )
+        df.loc[mask, val_col] - grouped_vals.transform("mean")
+    ) / grouped_vals.transform("std")
 
     # Descriptor whether the zscore exceeds the upper or lower threshold
     conditions = [
@@ -129,16 +152,23 @@ def calc_iqr(
     # Mask for when rollback_flag is false
     mask = ~df["rollback_flag"]
 
-    # Calculate quartiles only on unflagged data
-    quartiles = (
-        df[mask]
-        .groupby(group_col)[val_col]
-        .agg(
-            [
-                (f"{iqr_prefix}_q1", lambda x: x.quantile(iqr_lower_quantile)),
-                (f"{iqr_prefix}_q3", lambda x: x.quantile(iqr_upper_quantile)),
-            ]
-        )
+    # Calculate quartiles only on unflagged data, both in one grouped pass,
+    # selecting just the key and value columns to mask
+    group_cols = [group_col] if isinstance(group_col, str) else list(group_col)
+    quantile_levels = sorted({iqr_lower_quantile, iqr_upper_quantile})
+    quantiles = (
+        df.loc[mask, group_cols + [val_col]]
+        .groupby(group_col, sort=False, observed=True)[val_col]
+        .quantile(quantile_levels)
+        .unstack()
+        .reindex(columns=quantile_levels)
+    )
+    quartiles = pd.DataFrame(
+        {
+            f"{iqr_prefix}_q1": quantiles[iqr_lower_quantile],
+            f"{iqr_prefix}_q3": quantiles[iqr_upper_quantile],
+        },
+        index=quantiles.index,
     ).reset_index()
 
     # Assign quartiles back to the full DataFrame
@@ -187,15 +217,18 @@ def calc_lad_mean(
     Returns:
         pd.DataFrame: The DataFrame with an added 'mean_non_out_gdhi' column.
     """
-    # Separate out LSOAs that are not flagged
-    non_outlier_df = df[~df["master_flag"]]
-
     # Aggregate GDHI values for non-outlier LSOAs by LADs
-    non_outlier_df = non_outlier_df.groupby(["lad_code", "year"]).agg(
-        mean_non_out_gdhi=("uncon_gdhi", "mean")
+    non_outlier_mean = (
+        df.loc[~df["master_flag"]]
+        .groupby(["lad_code", "year"], sort=False, observed=True)["uncon_gdhi"]
+        .mean()
     )
 
-    df = df.join(non_outlier_df, on=["lad_code", "year"], how="left")
-    df = df[df["master_flag"]].reset_index(drop=True)
+    # Keep the flagged LSOAs only, then look their LAD means up by key rather
+    # than joining the whole DataFrame
+    df = df.loc[df["master_flag"]].reset_index(drop=True)
+    df["mean_non_out_gdhi"] = non_outlier_mean.reindex(
+        pd.MultiIndex.from_frame(df[["lad_code", "year"]])
+    ).to_numpy()
 
     return df
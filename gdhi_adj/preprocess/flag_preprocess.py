@@ -45,21 +45,23 @@ def create_master_flag(
     Returns:
         pd.DataFrame: The DataFrame with an additional 'master_flag' columns.
     """
+    # Factorize the LSOA codes once, for counting flagged rows per LSOA.
+    # Missing codes factorize to -1 and are never flagged
+    lsoa_codes = pd.factorize(df["lsoa_code"])[0]
+    has_lsoa = lsoa_codes >= 0
+    lsoa_codes = np.where(has_lsoa, lsoa_codes, 0)
+
     if zscore_calculation:
         # Create list of zscore flag columns (these should be the only columns
         # prefixed with 'z_')
         z_score_cols = [col for col in df.columns if col.startswith("z_")]
-        # Create a master flag that is True if any of the IQR columns are True
-        # Only group by LSOA as if any year is flagged, the LSOA is flagged
-        z_count = df.groupby("lsoa_code").agg(
-            {col: "sum" for col in z_score_cols}
-        )
-        z_count["master_z_flag"] = (z_count[z_score_cols] >= 1).sum(
-            axis=1
-        ) >= 1
-
-        # Join the master flags back to the original DataFrame
-        df = df.join(z_count[["master_z_flag"]], on="lsoa_code", how="left")
+        # Create a master flag that is True if any of the zscore columns are
+        # True. Only group by LSOA as if any year is flagged, the LSOA is
+        # flagged, so count flagged rows per LSOA and look the counts back up
+        z_flagged_rows = has_lsoa & df[z_score_cols].any(axis=1).to_numpy()
+        df["master_z_flag"] = (
+            np.bincount(lsoa_codes, weights=z_flagged_rows) > 0
+        )[lsoa_codes] & has_lsoa
 
     if iqr_calculation:
         # Create list of IQR flag columns (these should be the only columns
@@ -67,17 +69,10 @@ def create_master_flag(
         iqr_score_cols = [col for col in df.columns if col.startswith("iqr_")]
         # Create a master flag that is True if any of the IQR columns are True
         # Only group by LSOA as if any year is flagged, the LSOA is flagged
-        iqr_count = df.groupby("lsoa_code").agg(
-            {col: "sum" for col in iqr_score_cols}
-        )
-        iqr_count["master_iqr_flag"] = (iqr_count[iqr_score_cols] >= 1).sum(
-            axis=1
-        ) >= 1
-
-        # Join the master flags back to the original DataFrame
-        df = df.join(
-            iqr_count[["master_iqr_flag"]], on="lsoa_code", how="left"
-        )
+        iqr_flagged_rows = has_lsoa & df[iqr_score_cols].any(axis=1).to_numpy()
+        df["master_iqr_flag"] = (
+            np.bincount(lsoa_codes, weights=iqr_flagged_rows) > 0
+        )[lsoa_codes] & has_lsoa
 
     # Create a master flag that is True if all master flags are True.
     flag_cols = [col for col in df.columns if col.startswith("master_")]
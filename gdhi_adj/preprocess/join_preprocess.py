@@ -30,7 +30,7 @@ def constrain_to_reg_acc(
     )
 
     # Ensure that both DataFrames have the same columns for merging
-    if not reg_acc.columns.isin(df.columns).all():
+    if not set(reg_acc.columns) <= set(df.columns):
         raise ValueError("DataFrames have different columns for joining.")
 
     # Remove commas separating thousands and convert to numeric
@@ -39,10 +39,10 @@ def constrain_to_reg_acc(
             reg_acc["uncon_gdhi"].str.replace(",", "").astype("float64")
         )
 
-    reg_acc.rename(columns={"uncon_gdhi": "conlad_gdhi"}, inplace=True)
-
     df = df.merge(
-        reg_acc[["lad_code", "year", "conlad_gdhi"]],
+        reg_acc[["lad_code", "year", "uncon_gdhi"]].rename(
+            columns={"uncon_gdhi": "conlad_gdhi"}
+        ),
         on=["lad_code", "year"],
         how="left",
     )
@@ -56,9 +56,7 @@ def constrain_to_reg_acc(
     df["conlsoa_gdhi"] = df["uncon_gdhi"] * df["rate"]
     df["conlsoa_mean"] = df["mean_non_out_gdhi"] * df["rate"]
 
-    df["master_flag"] = df["master_flag"].replace(
-        {True: "TRUE", False: "MEAN"}
-    )
+    df["master_flag"] = np.where(df["master_flag"].to_numpy(), "TRUE", "MEAN")
 
     return df.drop(
         columns=[
@@ -85,8 +83,10 @@ def concat_wide_dataframes(
     # Join DataFrames and sort to match desired output for PowerBI
     df_wide = pd.concat([df_wide_outlier, df_wide_mean], ignore_index=True)
     df_wide.sort_values(
-        by=["lsoa_code", "master_flag"], ascending=[True, False], inplace=True
+        by=["lsoa_code", "master_flag"],
+        ascending=[True, False],
+        ignore_index=True,
+        inplace=True,
     )
-    df_wide.reset_index(drop=True, inplace=True)
 
     return df_wide
@@ -20,8 +20,8 @@ def pivot_years_long_dataframe(
     id_cols = [col for col in df.columns if col[0].isalpha()]
     df = df.melt(id_vars=id_cols, var_name=new_var_col, value_name=new_val_col)
 
-    # convert year column dtype from str to int
-    df["year"] = df["year"].astype(int)
+    # convert year column dtype from str to the smallest int that holds it
+    df["year"] = pd.to_numeric(df["year"], downcast="integer")
 
     return df
 
@@ -38,9 +38,11 @@ def pivot_output_long(
     Returns:
         pd.DataFrame: The pivoted DataFrame in long format.
     """
-    pivot_df = df.copy()
-    pivot_df.rename(columns={uncon_gdhi: "uncon"}, inplace=True)
-    pivot_df.rename(columns={con_gdhi: "CONLSOA"}, inplace=True)
+    # melt below copies the values, so the renamed frame can share them
+    pivot_df = df.copy(deep=False)
+    pivot_df.rename(
+        columns={uncon_gdhi: "uncon", con_gdhi: "CONLSOA"}, inplace=True
+    )
 
     id_cols = [
         "lsoa_code",
@@ -91,12 +93,8 @@ def pivot_wide_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     df.columns.name = None  # This removes the 'metric_date' label from columns
     df = df.reset_index()
 
-    df.rename(
-        columns=lambda col: (
-            col.replace("uncon_", "") if "uncon_" in col else col
-        ),
-        inplace=True,
-    )
+    # Strip the literal "uncon_" prefix from year columns
+    df.columns = df.columns.str.removeprefix("uncon_")
 
     # Reorder columns: move those with 'conlsoa' to the end
     cols = df.columns.tolist()
@@ -1,6 +1,6 @@
 """Module for pre-processing data in the gdhi_adj project."""
 
-import os
+from pathlib import Path
 
 import pandas as pd
 
@@ -8,7 +8,7 @@ from gdhi_adj.adjustment.filter_adjustment import filter_year
 from gdhi_adj.preprocess.calc_preprocess import (
     calc_iqr,
     calc_lad_mean,
-    calc_rate_of_change,
+    calc_rate_of_change_both_ways,
     calc_zscores,
 )
 from gdhi_adj.preprocess.flag_preprocess import (
@@ -24,7 +24,11 @@ from gdhi_adj.preprocess.pivot_preprocess import (
     pivot_wide_dataframe,
     pivot_years_long_dataframe,
 )
-from gdhi_adj.utils.helpers import read_with_schema, write_with_schema
+from gdhi_adj.utils.helpers import (
+    read_with_schema,
+    write_dataframe,
+    write_with_schema,
+)
 from gdhi_adj.utils.logger import GDHI_adj_logger
 
 GDHI_adj_LOGGER = GDHI_adj_logger(__name__)
@@ -62,17 +66,15 @@ def run_preprocessing(config: dict) -> None:
     filepath_dict = config[f"preprocessing_{local_or_shared}_settings"]
     schema_path = config["pipeline_settings"]["schema_path"]
 
+    # Input and output paths in the config are relative to the home folder
+    user_root = Path.home().as_posix()
+    input_dir = user_root + filepath_dict["input_dir"]
+
     input_unconstrained_file_path = (
-        "C:/Users/"
-        + os.getlogin()
-        + filepath_dict["input_dir"]
-        + filepath_dict["input_unconstrained_file_path"]
+        input_dir + filepath_dict["input_unconstrained_file_path"]
     )
     input_ra_lad_file_path = (
-        "C:/Users/"
-        + os.getlogin()
-        + filepath_dict["input_dir"]
-        + filepath_dict["input_ra_lad_file_path"]
+        input_dir + filepath_dict["input_ra_lad_file_path"]
     )
 
     # match = re.search(
@@ -105,7 +107,7 @@ def run_preprocessing(config: dict) -> None:
 
     transaction_name = config["user_settings"]["transaction_name"]
 
-    output_dir = "C:/Users/" + os.getlogin() + filepath_dict["output_dir"]
+    output_dir = user_root + filepath_dict["output_dir"]
     output_schema_path = (
         schema_path
         + config["pipeline_settings"]["output_preprocess_schema_path"]
@@ -130,20 +132,16 @@ def run_preprocessing(config: dict) -> None:
         ra_lad, new_var_col="year", new_val_col="uncon_gdhi"
     )
 
+    # Group and join keys repeat for every year, so hold them as categoricals
+    for col in ["lsoa_code", "lad_code"]:
+        df[col] = df[col].astype("category")
+
     logger.info("Filtering data for specified years")
     df = filter_year(df, start_year, end_year)
 
     logger.info("Calculating rate of change")
-    df = calc_rate_of_change(
-        df,
-        ascending=False,
-        sort_cols=["lsoa_code", "year"],
-        group_col="lsoa_code",
-        val_col="uncon_gdhi",
-    )
-    df = calc_rate_of_change(
+    df = calc_rate_of_change_both_ways(
         df,
-        ascending=True,
         sort_cols=["lsoa_code", "year"],
         group_col="lsoa_code",
         val_col="uncon_gdhi",
@@ -215,10 +213,7 @@ def run_preprocessing(config: dict) -> None:
     )
 
     logger.info(f"{output_dir + interim_filename}")
-    df.to_csv(
-        output_dir + interim_filename,
-        index=False,
-    )
+    write_dataframe(df, output_dir + interim_filename)
     logger.info("Data saved successfully")
 
     # Keep base data and flags, dropping scores columns
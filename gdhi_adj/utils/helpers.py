@@ -5,6 +5,7 @@ import os
 import pathlib
 from typing import Union
 
+import numpy as np
 import pandas as pd
 import toml
 import tomli  # tomli can be upgraded to tomllib in Python 3.11+
@@ -79,6 +80,8 @@ def validate_schema(df: pd.DataFrame, schema: dict):
         schema.
     """
     type_map = {"int": int, "float": float, "str": str, "bool": bool}
+    # NumPy dtype kinds whose every element maps to the expected Python type
+    dtype_kind_map = {"int": "iu", "float": "f", "bool": "b"}
 
     for column, props in schema.items():
         expected_type_str = props.get("Deduced_Data_Type")
@@ -86,7 +89,16 @@ def validate_schema(df: pd.DataFrame, schema: dict):
 
         if column not in df.columns:
             raise ValueError(f"Missing expected column: {column}")
-        if expected_type and not df[column].map(type).eq(expected_type).all():
+        if not expected_type:
+            continue
+
+        # Only check element types when the column dtype does not settle it
+        dtype = df[column].dtype
+        if isinstance(dtype, np.dtype) and dtype.kind in dtype_kind_map.get(
+            expected_type_str, ""
+        ):
+            continue
+        if not df[column].map(type).eq(expected_type).all():
             raise TypeError(
                 f"Column '{column}' does not match expected type"
                 f"{expected_type.__name__}"
@@ -175,12 +187,45 @@ def convert_column_types(
     return df
 
 
+def is_parquet_path(file_path: Union[str, pathlib.Path]) -> bool:
+    """
+    Check whether a file path points to a Parquet file.
+
+    Args:
+        file_path (Union[str, pathlib.Path]): The file path to check.
+
+    Returns:
+        bool: True if the file extension is .parquet, otherwise False.
+    """
+    return os.path.splitext(str(file_path))[1].lower() == ".parquet"
+
+
+def write_dataframe(df: pd.DataFrame, file_path: str) -> None:
+    """
+    Writes a DataFrame to a CSV file, or to Parquet if the file has a
+    .parquet extension.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to write.
+        file_path (str): Filepath to write the DataFrame to.
+
+    Returns:
+        None: Writes the DataFrame to file without its index.
+    """
+    if is_parquet_path(file_path):
+        df.to_parquet(file_path, compression="snappy", index=False)
+    else:
+        df.to_csv(file_path, index=False)
+
+
 def read_with_schema(
     input_file_path: str, input_schema_path: str
 ) -> pd.DataFrame:
     """
     Reads in a csv file and compares it to a data dictionary schema.
 
+    Files with a .parquet extension are read as Parquet instead of csv.
+
     Args:
         input_file_path (string): Filepath to the csv file to be read in.
         input_schema_path (string): Filepath to the schema file in TOML format.
@@ -191,7 +236,10 @@ def read_with_schema(
     """
     # Load data
     logger.info(f"Loading data from {input_file_path}")
-    df = pd.read_csv(input_file_path)
+    if is_parquet_path(input_file_path):
+        df = pd.read_parquet(input_file_path)
+    else:
+        df = pd.read_csv(input_file_path)
     logger.info("Data loaded successfully")
 
     # Load and validate schema
@@ -219,6 +267,9 @@ def write_with_schema(
     Writes a DataFrame to a CSV file, renaming columns and validating against a
     schema.
 
+    Output filenames with a .parquet extension are written as Parquet instead
+    of CSV.
+
     Args:
         df (pd.DataFrame): The final output DataFrame to write to CSV.
         output_schema_path (str): Path to the output schema file in TOML
@@ -254,7 +305,7 @@ def write_with_schema(
     logger.debug(
         f"Ensured output directory exists: {os.path.dirname(output_dir)}"
     )
-    # Convert DataFrame to CSV
+    # Convert DataFrame to CSV, or Parquet if requested
     logger.info(f"Saving data to {new_output_path}")
-    df.to_csv(new_output_path, index=False)
+    write_dataframe(df, new_output_path)
     logger.info("Data saved successfully")
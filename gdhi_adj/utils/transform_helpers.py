@@ -95,6 +95,91 @@ def increment_until_not_in(
         return year
 
 
+def year_in_years_to_adjust(df: pd.DataFrame) -> np.ndarray:
+    """Flag rows whose year is one of the row's years to adjust.
+
+    Equivalent to checking r["year"] in r["year_to_adjust"] for each row, but
+    iterates the underlying arrays rather than boxing every row as a Series.
+
+    Args:
+        df (pd.DataFrame): DataFrame with a year column and a list-like
+            year_to_adjust column.
+    Returns:
+        np.ndarray: Boolean array, True where year is in year_to_adjust.
+    """
+    return np.fromiter(
+        (
+            year in years_to_adjust
+            for year, years_to_adjust in zip(
+                df["year"].to_numpy(), df["year_to_adjust"].to_numpy()
+            )
+        ),
+        dtype=bool,
+        count=len(df),
+    )
+
+
+def adjust_year_run_bounds(df: pd.DataFrame) -> tuple:
+    """Find the run of consecutive years to adjust containing each row's year.
+
+    For each row, the years in year_to_adjust are split into runs of
+    consecutive years and the run containing the row's year is returned.
+    Rows whose year is not in year_to_adjust get NaN bounds.
+
+    Args:
+        df (pd.DataFrame): DataFrame with a year column and a list-like
+            year_to_adjust column.
+    Returns:
+        tuple: Two float arrays aligned to the rows of df, holding the first
+            and last year of the run.
+    """
+    years_to_adjust = df["year_to_adjust"].reset_index(drop=True).explode()
+    years_to_adjust = years_to_adjust.dropna()
+    runs = pd.DataFrame(
+        {
+            "row": years_to_adjust.index.to_numpy(),
+            "year": years_to_adjust.to_numpy().astype("int64"),
+        }
+    )
+    runs = runs.drop_duplicates().sort_values(["row", "year"])
+
+    row = runs["row"].to_numpy()
+    year = runs["year"].to_numpy()
+
+    # A new run starts on a new row or after a gap between years
+    new_run = np.ones(len(runs), dtype=bool)
+    new_run[1:] = (row[1:] != row[:-1]) | (np.diff(year) > 1)
+    run_years = runs.groupby(np.cumsum(new_run), sort=False)["year"]
+    run_start = run_years.transform("min").to_numpy()
+    run_end = run_years.transform("max").to_numpy()
+
+    # Keep the run holding each row's own year
+    own_year = year == df["year"].to_numpy()[row]
+    row_start = np.full(len(df), np.nan)
+    row_end = np.full(len(df), np.nan)
+    row_start[row[own_year]] = run_start[own_year]
+    row_end[row[own_year]] = run_end[own_year]
+
+    return row_start, row_end
+
+
+def lookup_lsoa_year_values(
+    lookup: pd.Series, lsoa_codes: pd.Series, years: pd.Series
+) -> np.ndarray:
+    """Look up values indexed by (lsoa_code, year) for pairs of keys.
+
+    Args:
+        lookup (pd.Series): Values indexed by unique (lsoa_code, year) pairs.
+        lsoa_codes (pd.Series): LSOA codes to look up.
+        years (pd.Series): Years to look up, aligned to lsoa_codes.
+    Returns:
+        np.ndarray: Looked up values aligned to the keys, NaN where the pair
+            is not in lookup.
+    """
+    keys = pd.MultiIndex.from_arrays([lsoa_codes.to_numpy(), years.to_numpy()])
+    return lookup.reindex(keys).to_numpy()
+
+
 def sum_match_check(
     df: pd.DataFrame,
     grouping_cols: list,
@@ -119,19 +204,13 @@ def sum_match_check(
     Returns:
         ValueError: if adjusted and unadjusted sums do not match.
     """
-    df["unadjusted_sum"] = df.groupby(grouping_cols)[unadjusted_col].transform(
-        "sum"
-    )
-
-    df["adjusted_sum"] = df.groupby(grouping_cols)[adjusted_col].transform(
-        "sum"
-    )
-
-    df["adjustment_check"] = abs(df["unadjusted_sum"] - df["adjusted_sum"])
-
-    df = df[df["adjustment_check"] > sum_tolerance]
+    # Compare one sum per group rather than broadcasting sums back to rows
+    sums = df.groupby(grouping_cols, sort=False, observed=True)[
+        [unadjusted_col, adjusted_col]
+    ].sum()
+    adjustment_check = abs(sums[unadjusted_col] - sums[adjusted_col])
 
-    if not df.empty:
+    if (adjustment_check > sum_tolerance).any():
         raise ValueError(
             "Adjustment check failed: LAD sums do not match after adjustment."
         )
@@ -179,6 +179,30 @@ class TestApportionNegativeAdjustment:
             result_df, expected_df, check_dtype=False
         )
 
+    def test_apportion_negative_adjustment_validate(self):
+        """Test apportion_negative_adjustment only raises the LAD sum check
+        error when validate is True.
+        """
+
+        df = pd.DataFrame({
+            "lsoa_code": ["E1", "E2"],
+            "lad_code": ["E01", "E01"],
+            "year": [2000, 2000],
+            "con_gdhi": [1.0, 2.0],
+            "lad_total": [4.0, 4.0],
+            "adjusted_con_gdhi": [-1.0, 5.0],
+        })
+
+        with pytest.raises(
+            ValueError,
+            match="Adjustment check failed:"
+        ):
+            apportion_negative_adjustment(df)
+
+        result_df = apportion_negative_adjustment(df, validate=False)
+
+        assert result_df["readjusted_con_gdhi"].tolist() == [0.0, 4.0]
+
     def test_apportion_negative_adjustment_remains_negative(self):
         """Test apportion_negative_adjustment returns ValueError when the
         adjusted_con_gdhi still contains a negative value after adjustment.
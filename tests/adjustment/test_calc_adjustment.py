@@ -92,3 +92,47 @@ class TestExtrapolateImputedVal:
         pd.testing.assert_frame_equal(
             result_df, expected_df, check_names=False
         )
+
+    def test_extrapolate_imputed_val_from_previous(self):
+        """Test extrapolate_imputed_val extrapolates forwards from the previous
+        safe year when there is no next safe year.
+        """
+        df = pd.DataFrame({
+            "lsoa_code": ["E1", "E1", "E1", "E1", "E1", "E1"],
+            "year": [2002, 2003, 2004, 2005, 2006, 2007],
+            "con_gdhi": [13.0, 40.0, 49.0, 55.0, 63.0, 90.0],
+            "year_to_adjust": [[2007]] * 6,
+            "rollback_flag": [False] * 6,
+        })
+
+        imputed_df = pd.DataFrame({
+            "lsoa_code": ["E1"],
+            "year": [2007],
+            "con_gdhi": [90.0],
+            "year_to_adjust": [[2007]],
+            "rollback_flag": [False],
+            "prev_safe_year": [2006],
+            "prev_con_gdhi": [63.0],
+            "next_safe_year": [2008],
+            "next_con_gdhi": [np.nan],
+            "imputed_gdhi": [np.nan],
+        })
+
+        result_df = extrapolate_imputed_val(df, imputed_df)
+
+        expected_df = pd.DataFrame({
+            "lsoa_code": ["E1"],
+            "year": [2007],
+            "con_gdhi": [90.0],
+            "year_to_adjust": [[2007]],
+            "rollback_flag": [False],
+            "prev_safe_year": [2006],
+            "prev_con_gdhi": [63.0],
+            "next_safe_year": [2008],
+            "next_con_gdhi": [np.nan],
+            "imputed_gdhi": [75.5],
+        })
+
+        pd.testing.assert_frame_equal(
+            result_df, expected_df, check_names=False
+        )
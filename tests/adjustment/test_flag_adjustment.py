@@ -60,3 +60,28 @@ class TestIdentifySafeYears:
 
         pd.testing.assert_frame_equal(base_df, df)
         pd.testing.assert_frame_equal(result_df, expected_df)
+
+    def test_identify_safe_years_none_to_adjust(self):
+        """Test identify_safe_years when no years are flagged to adjust."""
+        df = pd.DataFrame({
+            "lsoa_code": ["E1", "E1", "E2"],
+            "year": [2000, 2001, 2000],
+            "con_gdhi": [10.0, 20.0, 50.0],
+            "year_to_adjust": [[], [], []],
+        })
+
+        base_df, result_df = identify_safe_years(
+            df, start_year=2000, end_year=2001
+        )
+
+        assert result_df.empty
+        assert result_df.columns.tolist() == [
+            "lsoa_code",
+            "year",
+            "con_gdhi",
+            "year_to_adjust",
+            "prev_safe_year",
+            "prev_con_gdhi",
+            "next_safe_year",
+            "next_con_gdhi",
+        ]
@@ -7,6 +7,7 @@ from gdhi_adj.mapping.mapping_main import (
     aggregate_lad,
     clean_validate_mapper,
     join_mapper,
+    probe_s30_codes,
     reformat,
     rename_s30_to_lau,
 )
@@ -53,6 +54,26 @@ def test_rename_s30_to_lau(df_input, expected_columns, expected_mapping):
     assert mapping_flag == expected_mapping
 
 
+@pytest.mark.parametrize("file_name", ["adjusted.csv", "adjusted.parquet"])
+@pytest.mark.parametrize(
+    "df_input,expected",
+    [
+        (pd.DataFrame({"lad_code": ["E101", "S302"], "x": [1, 2]}), True),
+        (pd.DataFrame({"lad_code": ["E101", "E102"], "x": [1, 2]}), False),
+        (pd.DataFrame({"other_col": ["S301", "S302"]}), False),
+    ],
+)
+def test_probe_s30_codes(tmp_path, file_name, df_input, expected):
+    """Test probing a file's LAD code column for S30 codes."""
+    file_path = str(tmp_path / file_name)
+    if file_name.endswith(".parquet"):
+        df_input.to_parquet(file_path, index=False)
+    else:
+        df_input.to_csv(file_path, index=False)
+
+    assert probe_s30_codes(file_path, "lad_code") == expected
+
+
 def test_clean_validate_mapper():
     """Test mapper cleaning and validation."""
     df = pd.DataFrame({
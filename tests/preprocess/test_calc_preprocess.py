@@ -1,68 +1,58 @@
 import pandas as pd
+import pytest
 
 from gdhi_adj.preprocess.calc_preprocess import (
     calc_iqr,
     calc_lad_mean,
-    calc_rate_of_change,
+    calc_rate_of_change_both_ways,
     calc_zscores,
 )
 
 
-class TestCalcRateOfChange:
-    """Tests for calc_rate_of_change function."""
+def test_calc_rate_of_change_both_ways():
+    """Test calc_rate_of_change_both_ways calculates the backward and forward
+    rate of change, including around missing values."""
+    df = pd.DataFrame({
+        "lsoa_code": ["E1", "E2", "E1", "E2", "E1", "E2"],
+        "year": [2001, 2001, 2002, 2002, 2003, 2003],
+        "uncon_gdhi": [100.0, 200.0, None, 240.0, 121.0, 300.0]
+    })
 
-    def test_calc_rate_of_change_forward(self):
-        """Test the calc_rate_of_change function for forward rate of change."""
-        df = pd.DataFrame({
-            "lsoa_code": ["E1", "E2", "E1", "E2"],
-            "year": [2001, 2001, 2002, 2002],
-            "uncon_gdhi": [100, 200, 110, 240]
-        })
+    result_df = calc_rate_of_change_both_ways(
+        df,
+        sort_cols=["lsoa_code", "year"],
+        group_col="lsoa_code",
+        val_col="uncon_gdhi"
+    )
 
-        # Calculate forward rate of change
-        result_df = calc_rate_of_change(
-            df,
-            ascending=True,
-            sort_cols=["lsoa_code", "year"],
-            group_col="lsoa_code",
-            val_col="uncon_gdhi"
-        )
+    expected_df = pd.DataFrame({
+        "lsoa_code": ["E1", "E1", "E1", "E2", "E2", "E2"],
+        "year": [2001, 2002, 2003, 2001, 2002, 2003],
+        "uncon_gdhi": [100.0, None, 121.0, 200.0, 240.0, 300.0],
+        "backward_pct_change": [0.82645, 1.0, None, 0.83333, 0.8, None],
+        "forward_pct_change": [None, 1.0, 1.21, None, 1.2, 1.25]
+    })
 
-        expected_df = pd.DataFrame({
-            "lsoa_code": ["E1", "E1", "E2", "E2"],
-            "year": [2001, 2002, 2001, 2002],
-            "uncon_gdhi": [100, 110, 200, 240],
-            "forward_pct_change": [None, 1.1, None, 1.2]
-        })
+    pd.testing.assert_frame_equal(result_df, expected_df, rtol=1e-4)
 
-        pd.testing.assert_frame_equal(result_df, expected_df)
 
-    def test_calc_rate_of_change_backward(self):
-        """Test calc_rate_of_change function for backward rate of change."""
-        df = pd.DataFrame({
-            "lsoa_code": ["E1", "E2", "E1", "E2"],
-            "year": [2001, 2001, 2002, 2002],
-            "uncon_gdhi": [100, 200, 110, 240]
-        })
+def test_calc_rate_of_change_both_ways_sort_cols():
+    """Test calc_rate_of_change_both_ways raises an error when the rows of a
+    group would not be contiguous after sorting."""
+    df = pd.DataFrame({
+        "lsoa_code": ["E1", "E2"],
+        "year": [2001, 2001],
+        "uncon_gdhi": [100.0, 200.0]
+    })
 
-        # Calculate backward rate of change
-        result_df = calc_rate_of_change(
+    with pytest.raises(ValueError, match="sort_cols must start with"):
+        calc_rate_of_change_both_ways(
             df,
-            ascending=False,
-            sort_cols=["lsoa_code", "year"],
+            sort_cols=["year", "lsoa_code"],
             group_col="lsoa_code",
             val_col="uncon_gdhi"
         )
 
-        expected_df = pd.DataFrame({
-            "lsoa_code": ["E2", "E2", "E1", "E1"],
-            "year": [2002, 2001, 2002, 2001],
-            "uncon_gdhi": [240, 200, 110, 100],
-            "backward_pct_change": [None, 0.83333, None, 0.90909]
-        })
-
-        pd.testing.assert_frame_equal(result_df, expected_df)
-
 
 class TestCalcZscores:
     """Tests for calc_zscores function."""
@@ -81,3 +81,25 @@ class TestMasterFlag:
         })
 
         pd.testing.assert_frame_equal(result_df, expected_df)
+
+    def test_create_master_flag_missing_lsoa_code(self):
+        """Test create_master_flag does not flag rows missing an LSOA code."""
+        df = pd.DataFrame({
+            "lsoa_code": ["E1", "E1", None],
+            "year": [2001, 2002, 2001],
+            "z_bkwd_flag":      [True, False, True],
+        })
+
+        result_df = create_master_flag(
+            df, zscore_calculation=True, iqr_calculation=False
+        )
+
+        expected_df = pd.DataFrame({
+            "lsoa_code": ["E1", "E1", None],
+            "year": [2001, 2002, 2001],
+            "z_bkwd_flag":      [True, False, True],
+            "master_z_flag":    [True, True, False],
+            "master_flag":      [True, True, False],
+        })
+
+        pd.testing.assert_frame_equal(result_df, expected_df)
@@ -28,6 +28,7 @@ def test_pivot_years_long_dataframe():
     })
 
     pd.testing.assert_frame_equal(result_df, expected_df, check_dtype=False)
+    assert result_df["year"].dtype == "int16"
 
 
 def test_pivot_output_long():
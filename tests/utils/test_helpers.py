@@ -4,8 +4,10 @@ import pytest
 import toml
 
 from gdhi_adj.utils.helpers import (
+    is_parquet_path,
     read_with_schema,
     rename_columns,
+    validate_schema,
     write_with_schema,
 )
 from gdhi_adj.utils.logger import GDHI_adj_logger
@@ -117,6 +119,27 @@ def test_rename_columns(input_data, test_schema, expout_data):
 #         rename_columns(input_data, test_schema_wrong_col, logger)
 
 
+def test_validate_schema_types():
+    """Test validate_schema accepts matching numeric dtypes and rejects
+    columns with elements of the wrong type."""
+    schema = {
+        "year": {"old_name": "Year", "Deduced_Data_Type": "int"},
+        "gdhi": {"old_name": "GDHI", "Deduced_Data_Type": "float"},
+        "lsoa_code": {"old_name": "LSOA code", "Deduced_Data_Type": "str"},
+    }
+    df = pd.DataFrame({
+        "year": [2010, 2011],
+        "gdhi": [1.5, float("nan")],
+        "lsoa_code": ["A1", "B2"],
+    })
+
+    validate_schema(df, schema)
+
+    df["lsoa_code"] = ["A1", 2]
+    with pytest.raises(TypeError, match="Column 'lsoa_code'"):
+        validate_schema(df, schema)
+
+
 def test_read_with_schema(test_csv_file, test_schema_file, expout_data):
     # Creating df using the function and test csv
     df = read_with_schema(test_csv_file, test_schema_file)
@@ -127,6 +150,25 @@ def test_read_with_schema(test_csv_file, test_schema_file, expout_data):
     pytest.raises(KeyError, match="Old col name")  # Ensure old col not present
 
 
+def test_is_parquet_path(tmp_path):
+    """Test is_parquet_path identifies Parquet files by extension."""
+    assert is_parquet_path("data/output.parquet")
+    assert is_parquet_path(tmp_path / "output.PARQUET")
+    assert not is_parquet_path("data/output.csv")
+
+
+def test_read_with_schema_parquet(
+        tmp_path, input_data, test_schema_file, expout_data
+):
+    """Test reading a Parquet file with schema."""
+    filepath = tmp_path / "test.parquet"
+    input_data.to_parquet(filepath, index=False)
+
+    df = read_with_schema(filepath, test_schema_file)
+
+    pd.testing.assert_frame_equal(df, expout_data)
+
+
 def test_read_with_schema_missing_col(
         test_csv_file, test_schema_file_wrong_col
 ):
@@ -154,6 +196,20 @@ def test_write_with_schema(
     pd.testing.assert_frame_equal(output_df, expout_data)
 
 
+def test_write_with_schema_parquet(
+        tmp_path, input_data, test_schema_file, expout_data
+):
+    """Test writing a Parquet file with schema."""
+    output_filepath = tmp_path / "test_output.parquet"
+    write_with_schema(
+        input_data, test_schema_file, output_filepath, "test_output.parquet"
+    )
+
+    output_df = pd.read_parquet(output_filepath)
+
+    pd.testing.assert_frame_equal(output_df, expout_data)
+
+
 def test_write_with_schema_missing_col(
         tmp_path, input_data, test_schema_file_wrong_col
 ):
@@ -3,10 +3,13 @@ import pandas as pd
 import pytest
 
 from gdhi_adj.utils.transform_helpers import (
+    adjust_year_run_bounds,
     ensure_list,
     increment_until_not_in,
+    lookup_lsoa_year_values,
     sum_match_check,
     to_int_list,
+    year_in_years_to_adjust,
 )
 
 
@@ -82,6 +85,59 @@ def test_increment_until_not_in():
     assert increment_until_not_in(2004, [2005], 2005, False) == 2004
 
 
+def test_year_in_years_to_adjust():
+    """Test year_in_years_to_adjust flags years listed for adjustment."""
+    df = pd.DataFrame({
+        "year": [2010, 2011, 2012, 2013],
+        "year_to_adjust": [[2010], [2010, 2012], [2012, 2013], []],
+    })
+
+    result = year_in_years_to_adjust(df)
+
+    np.testing.assert_array_equal(result, [True, False, True, False])
+    assert result.dtype == bool
+
+
+def test_adjust_year_run_bounds():
+    """Test adjust_year_run_bounds finds the run of consecutive years to
+    adjust around each row's year."""
+    df = pd.DataFrame({
+        "year": [2011, 2012, 2015, 2015, 2013],
+        "year_to_adjust": [
+            [2011, 2012, 2015],
+            [2012, 2011, 2015],
+            [2011, 2012, 2015],
+            [2015, 2016, 2017],
+            [2011, 2012],
+        ],
+    })
+
+    run_start, run_end = adjust_year_run_bounds(df)
+
+    np.testing.assert_array_equal(
+        run_start, [2011, 2011, 2015, 2015, np.nan]
+    )
+    np.testing.assert_array_equal(run_end, [2012, 2012, 2015, 2017, np.nan])
+
+
+def test_lookup_lsoa_year_values():
+    """Test lookup_lsoa_year_values returns values for (lsoa_code, year)
+    pairs, with NaN for missing pairs and missing years."""
+    lookup = pd.DataFrame({
+        "lsoa_code": ["E1", "E1", "E2"],
+        "year": [2010, 2011, 2010],
+        "con_gdhi": [1.0, 2.0, 3.0],
+    }).set_index(["lsoa_code", "year"])["con_gdhi"]
+
+    result = lookup_lsoa_year_values(
+        lookup,
+        pd.Series(["E1", "E2", "E3", "E1"]),
+        pd.Series([2011.0, 2010.0, 2010.0, np.nan]),
+    )
+
+    np.testing.assert_array_equal(result, [2.0, 3.0, np.nan, np.nan])
+
+
 class TestSumMatchCheck():
     """Test suite for sum_match_check function."""
     def test_sum_match_check_success_and_tolerance(self):
@@ -97,10 +153,12 @@ class TestSumMatchCheck():
             "adjusted": [10.0, 20.0, 30.0, 40.0],
         })
 
-        # should not raise
+        # should not raise, and should leave the input unchanged
+        df_exact_before = df_exact.copy()
         sum_match_check(
-            df_exact.copy(), ["lad_code", "year"], "unadjusted", "adjusted"
+            df_exact, ["lad_code", "year"], "unadjusted", "adjusted"
         )
+        pd.testing.assert_frame_equal(df_exact, df_exact_before)
 
         # within-tolerance case: per-group sum differs by less than default
         # tolerance